@@ -6,23 +6,36 @@ This module provides a thin wrapper around adbutils to:
 - Send generic shell commands
 - Send Unreal Engine broadcast console commands
 """
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+import re
 import shlex
 
 try:
-    from adbutils import adb, AdbDevice
+    from adbutils import adb, AdbDevice, AdbTimeout
 except Exception as e:  # pragma: no cover
     raise RuntimeError("Failed to import adbutils. Ensure it is installed inside the venv.") from e
 
 ADB_BROADCAST_ACTION = "android.intent.action.RUN"
 EXTRA_KEY = "cmd"
 
+# Typical UE commands (`stat fps`, `r.MSAACount 4`) need no escaping inside single quotes.
+_SAFE_RE = re.compile(r"\A[A-Za-z0-9._\- ]+\Z")
+
 
 def list_devices() -> List[AdbDevice]:
     """Return a list of connected ADB devices."""
     return adb.device_list()
 
 
+def track_devices() -> Iterator[object]:
+    """Yield an event each time the adb server reports a device change.
+
+    Blocks between events; raises once the adb server connection is lost.
+    """
+    return adb.track_devices()
+
+
 def get_default_device() -> Optional[AdbDevice]:
     devices = list_devices()
     return devices[0] if devices else None
@@ -31,32 +44,73 @@ def get_default_device() -> Optional[AdbDevice]:
 def shell(device: Optional[AdbDevice], command: str, timeout: int = 10) -> Tuple[bool, str]:
     """Execute a shell command on the given device (or default).
 
+    `timeout` (seconds) bounds each socket read, so an unresponsive device
+    fails the call instead of blocking the caller indefinitely.
+
     Returns (ok, output_or_error)
     """
-    dev = device or get_default_device()
-    if dev is None:
-        return False, "No ADB devices connected."
     try:
-        # adbutils shell does not expose timeout directly; rely on underlying implementation.
-        out = dev.shell(command)
+        # Resolving the default device queries adb too, so its failures are reported the same way
+        dev = device or get_default_device()
+        if dev is None:
+            return False, "No ADB devices connected."
+        out = dev.shell(command, timeout=timeout)
         return True, out.strip()
+    except (AdbTimeout, TimeoutError):
+        return False, f"Shell command timed out after {timeout}s."
     except Exception as e:  # pragma: no cover
         return False, f"Shell command failed: {e}"
 
 
 def _quote_single(s: str) -> str:
+    if _SAFE_RE.match(s):
+        return f"'{s}'"
     # Use shlex.quote for robust quoting; Android shell (sh) honors single-quoted strings.
     return shlex.quote(s)
 
 
+def _broadcast_command(cmd: str) -> str:
+    return f"am broadcast -a {ADB_BROADCAST_ACTION} -e {EXTRA_KEY} {_quote_single(cmd)}"
+
+
 def send_unreal_command(cmd: str, device: Optional[AdbDevice] = None) -> Tuple[bool, str]:
     """Send an Unreal command via broadcast intent.
 
     Returns (ok, message)
     """
-    quoted = _quote_single(cmd)
-    broadcast_cmd = f"am broadcast -a {ADB_BROADCAST_ACTION} -e {EXTRA_KEY} {quoted}"
-    return shell(device, broadcast_cmd)
+    return shell(device, _broadcast_command(cmd))
+
+
+def send_unreal_commands(cmds: List[str], device: Optional[AdbDevice] = None) -> Tuple[bool, str]:
+    """Send several Unreal commands, in order, through a single shell invocation.
+
+    The broadcasts are chained with `;` so the adb connection and shell
+    startup are paid once for the whole batch rather than per command.
+
+    Returns (ok, combined_output)
+    """
+    if not cmds:
+        return False, "No commands to send."
+    return shell(device, " ; ".join(_broadcast_command(cmd) for cmd in cmds))
+
+
+def send_unreal_command_all(
+    cmd: str, devices: Optional[List[AdbDevice]] = None
+) -> List[Tuple[str, bool, str]]:
+    """Send an Unreal command to several devices concurrently.
+
+    Each broadcast runs on its own worker thread, so total latency is the
+    slowest device's round-trip rather than the sum. Defaults to every
+    connected device.
+
+    Returns [(serial, ok, message), ...] in device order.
+    """
+    devs = list_devices() if devices is None else list(devices)
+    if not devs:
+        return []
+    with ThreadPoolExecutor(max_workers=len(devs)) as pool:
+        results = list(pool.map(lambda dev: send_unreal_command(cmd, dev), devs))
+    return [(dev.serial, ok, msg) for dev, (ok, msg) in zip(devs, results)]
 
 
 def ensure_adb_available() -> Tuple[bool, str]:
@@ -71,9 +125,12 @@ def ensure_adb_available() -> Tuple[bool, str]:
 
 __all__ = [
     "list_devices",
+    "track_devices",
     "get_default_device",
     "shell",
     "send_unreal_command",
+    "send_unreal_command_all",
+    "send_unreal_commands",
     "ensure_adb_available",
     "ADB_BROADCAST_ACTION",
     "EXTRA_KEY",
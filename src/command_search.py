@@ -0,0 +1,73 @@
+"""Search indexes over command names for autocomplete.
+
+Substring ("contains") lookups go to an in-memory SQLite FTS5 table with
+the trigram tokenizer, so they are answered from the index instead of
+scanning every name. Terms shorter than a trigram, or a SQLite build
+without FTS5/trigram (older than 3.34), use a plain `instr` scan.
+
+Prefix lookups use a sorted list of lowercased names and `bisect`, so
+they cost O(log N) however large the catalog is.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+import sqlite3
+from typing import Iterable, List
+
+DEFAULT_LIMIT = 50
+
+
+class CommandSearchIndex:
+    def __init__(self, names: Iterable[str] = ()):
+        self._sorted_lc: List[str] = []
+        self._sorted_names: List[str] = []
+        self._db = sqlite3.connect(":memory:")
+        try:
+            self._db.execute("CREATE VIRTUAL TABLE cmd_names USING fts5(name, tokenize='trigram')")
+            self.uses_fts = True
+        except sqlite3.OperationalError:
+            self._db.execute("CREATE TABLE cmd_names (name TEXT)")
+            self.uses_fts = False
+        self.set_names(names)
+
+    def set_names(self, names: Iterable[str]) -> None:
+        """Replace the indexed names (contains results keep the given order)."""
+        names = list(names)
+        pairs = sorted((name.lower(), name) for name in names)
+        self._sorted_lc = [lc for lc, _ in pairs]
+        self._sorted_names = [name for _, name in pairs]
+        with self._db:
+            self._db.execute("DELETE FROM cmd_names")
+            self._db.executemany("INSERT INTO cmd_names (name) VALUES (?)", ((name,) for name in names))
+
+    def search(self, term: str, limit: int = DEFAULT_LIMIT) -> List[str]:
+        """Return up to `limit` names containing `term`, case-insensitively."""
+        term = term.strip()
+        if not term:
+            return []
+        if self.uses_fts and len(term) >= 3:
+            # A quoted trigram phrase is a substring match served by the index
+            phrase = '"' + term.replace('"', '""') + '"'
+            rows = self._db.execute(
+                "SELECT name FROM cmd_names WHERE name MATCH ? ORDER BY rowid LIMIT ?",
+                (phrase, limit),
+            )
+        else:
+            rows = self._db.execute(
+                "SELECT name FROM cmd_names WHERE instr(lower(name), ?) > 0 ORDER BY rowid LIMIT ?",
+                (term.lower(), limit),
+            )
+        return [row[0] for row in rows]
+
+    def search_prefix(self, term: str, limit: int = DEFAULT_LIMIT) -> List[str]:
+        """Return up to `limit` names starting with `term`, case-insensitively, sorted."""
+        prefix = term.strip().lower()
+        if not prefix:
+            return []
+        lo = bisect_left(self._sorted_lc, prefix)
+        # Every name with this prefix sorts before prefix + U+FFFF
+        hi = bisect_left(self._sorted_lc, prefix + "\uffff", lo)
+        return self._sorted_names[lo:min(hi, lo + limit)]
+
+
+__all__ = ["CommandSearchIndex", "DEFAULT_LIMIT"]
@@ -9,9 +9,14 @@ empty list.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+import json
+import mmap
+import os
+import pickle
 import re
+import sys
 from typing import List, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -19,34 +24,176 @@ DEFAULT_HTML_CANDIDATES = (
     PROJECT_ROOT / "ConsoleHelp.html",
     PROJECT_ROOT / "Saved" / "ConsoleHelp.html",
 )
+CACHE_DIR = PROJECT_ROOT / ".cache"
+# Bump whenever the parsed representation changes so stale caches are ignored.
+_CACHE_VERSION = 7
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnrealCommand:
     name: str
     help: str
     type: str  # e.g. Cmd / Exec / others
+    # Casefolded once at construction for case-insensitive filtering
+    haystack_cf: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        # NUL separator stops a term from matching across the name/help boundary
+        object.__setattr__(self, "haystack_cf", f"{self.name}\x00{self.help}".casefold())
 
-_JS_ARRAY_START = re.compile(r"var\s+cvars\s*=\s*\[", re.IGNORECASE)
+
+# In-process memo keyed on (path, st_mtime_ns, st_size); sits in front of the disk cache.
+_MEMO: dict[tuple[Path, int, int], List[UnrealCommand]] = {}
+
+# Bytes patterns: the array bounds are located directly in the mmapped file.
+_JS_ARRAY_START = re.compile(rb"var\s+cvars\s*=\s*\[", re.IGNORECASE)
 _JS_ENTRY_REGEX = re.compile(
     r"\{\s*name\s*:\s*\"(?P<name>(?:\\.|[^\"])*)\"\s*,\s*help\s*:\s*\"(?P<help>(?:\\.|[^\"])*)\"\s*,\s*type\s*:\s*\"(?P<type>(?:\\.|[^\"])*)\"\s*\}",
     re.DOTALL,
 )
 
-_DEF_END_REGEX = re.compile(r"\];")
+_DEF_END_REGEX = re.compile(rb"\];")
+
+# JS -> JSON fixups for the cvars array: strip `//` comment lines, quote the three
+# keys as UE emits them and rewrite backslash escapes JSON doesn't accept. Any other
+# layout fails json.loads and falls back to the entry regex.
+_JS_COMMENT_LINE = re.compile(r"^\s*//.*$", re.MULTILINE)
+_JS_KEY_REPLACEMENTS = (
+    ("{name:", '{"name":'),
+    ('", help:', '", "help":'),
+    ('", type:', '", "type":'),
+)
+_JS_BACKSLASH_REGEX = re.compile(r"\\(.)", re.DOTALL)
+_JSON_ESCAPE_CHARS = frozenset('"\\/bfnrtu')
+
+
+_ESCAPES = {
+    "\\n": "\n",
+    "\\t": "\t",
+    "\\r": "\r",
+    '\\"': '"',
+    "\\'": "'",
+    "\\\\": "\\",
+    "\\/": "/",
+}
+_ESCAPE_REGEX = re.compile(r"\\(?:[ntr\"'\\/]|u[0-9a-fA-F]{4})")
+
+
+def _unescape(match: re.Match) -> str:
+    seq = match.group()
+    if seq[1] == "u":
+        return chr(int(seq[2:], 16))
+    return _ESCAPES[seq]
 
 
 def _decode_js_string(text: str) -> str:
-    try:
-        # Use unicode_escape to unescape sequences such as \n, \", \' etc.
-        return bytes(text, "utf-8").decode("unicode_escape")
-    except Exception:
+    # Only the handful of escapes UE emits are translated; anything else is kept verbatim.
+    if "\\" not in text:
         return text
+    return _ESCAPE_REGEX.sub(_unescape, text)
+
+
+def _jsonify_escape(match: re.Match) -> str:
+    char = match.group(1)
+    if char in _JSON_ESCAPE_CHARS:
+        return match.group()
+    if char == "'":
+        return "'"
+    # Unknown escapes are kept verbatim, as _decode_js_string does
+    return "\\\\" + char
 
 
 def _sanitize_help(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    # split() with no separator collapses whitespace runs and trims both ends
+    return " ".join(text.split())
+
+
+def _cache_path(path: Path) -> Path:
+    return CACHE_DIR / f"{path.stem}.cache.pkl"
+
+
+def _read_cache(path: Path, stat: os.stat_result) -> Optional[List[UnrealCommand]]:
+    """Return cached commands if the cache matches the HTML file's mtime+size."""
+    try:
+        with _cache_path(path).open("rb") as f:
+            version, source, mtime_ns, size, commands = pickle.load(f)
+    except Exception:
+        return None
+    if (version, source, mtime_ns, size) != (_CACHE_VERSION, str(path), stat.st_mtime_ns, stat.st_size):
+        return None
+    return commands
+
+
+def _write_cache(path: Path, stat: os.stat_result, commands: List[UnrealCommand]) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with _cache_path(path).open("wb") as f:
+            pickle.dump(
+                (_CACHE_VERSION, str(path), stat.st_mtime_ns, stat.st_size, commands),
+                f,
+                protocol=5,
+            )
+    except Exception:
+        # The cache is only an optimisation; a read-only checkout still works.
+        pass
+
+
+def _parse_commands(path: Path) -> List[UnrealCommand]:
+    # Map the file and locate the array block in bytes so only that slice is decoded.
+    try:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            start_match = _JS_ARRAY_START.search(content)
+            if not start_match:
+                return []
+            start_idx = start_match.end()
+            end_match = _DEF_END_REGEX.search(content, start_idx)
+            if not end_match:
+                return []
+            array_block = content[start_idx:end_match.start()].decode("utf-8", errors="ignore")
+    except (OSError, ValueError):
+        # ValueError: mmap refuses empty files.
+        return []
+
+    commands = _parse_json_array(array_block)
+    if commands is not None:
+        return commands
+    return _parse_regex_array(array_block)
+
+
+def _parse_json_array(array_block: str) -> Optional[List[UnrealCommand]]:
+    """Parse the array with the C json decoder; None if the block isn't JSON-compatible."""
+    fixed = _JS_COMMENT_LINE.sub("", array_block)
+    for js_key, json_key in _JS_KEY_REPLACEMENTS:
+        fixed = fixed.replace(js_key, json_key)
+    fixed = _JS_BACKSLASH_REGEX.sub(_jsonify_escape, fixed).rstrip().rstrip(",")
+    try:
+        # strict=False tolerates raw control characters inside help strings
+        entries = json.loads(f"[{fixed}]", strict=False)
+        return [
+            UnrealCommand(
+                name=entry["name"],
+                help=_sanitize_help(entry["help"]),
+                # Only a handful of distinct types; share one string object per value
+                type=sys.intern(entry["type"]),
+            )
+            for entry in entries
+        ]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _parse_regex_array(array_block: str) -> List[UnrealCommand]:
+    commands: List[UnrealCommand] = []
+    # findall yields (name, help, type) tuples directly; no Match objects per entry.
+    for name, help_raw, ctype in _JS_ENTRY_REGEX.findall(array_block):
+        commands.append(
+            UnrealCommand(
+                name=_decode_js_string(name),
+                help=_sanitize_help(_decode_js_string(help_raw)),
+                type=sys.intern(_decode_js_string(ctype)),
+            )
+        )
+    return commands
 
 
 def load_commands(html_path: Optional[Path] = None) -> List[UnrealCommand]:
@@ -60,31 +207,22 @@ def load_commands(html_path: Optional[Path] = None) -> List[UnrealCommand]:
                 break
         if path is None:
             path = DEFAULT_HTML_CANDIDATES[0]
-    if not path.exists():
-        return []
     try:
-        content = path.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
+        stat = path.stat()
+    except OSError:
         return []
 
-    # Locate the array block
-    start_match = _JS_ARRAY_START.search(content)
-    if not start_match:
-        return []
-    start_idx = start_match.end()
-    end_match = _DEF_END_REGEX.search(content, start_idx)
-    if not end_match:
-        return []
-    array_block = content[start_idx:end_match.start()]
-
-    commands: List[UnrealCommand] = []
-    for m in _JS_ENTRY_REGEX.finditer(array_block):
-        name = _decode_js_string(m.group("name"))
-        help_raw = _decode_js_string(m.group("help"))
-        ctype = _decode_js_string(m.group("type"))
-        help_text = _sanitize_help(help_raw)
-        commands.append(UnrealCommand(name=name, help=help_text, type=ctype))
-    return commands
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    commands = _MEMO.get(key)
+    if commands is None:
+        commands = _read_cache(path, stat)
+        if commands is None:
+            commands = _parse_commands(path)
+            if commands:
+                _write_cache(path, stat, commands)
+        _MEMO[key] = commands
+    # Shallow copy so callers can't mutate the memoised list
+    return list(commands)
 
 
 def load_command_names(html_path: Optional[Path] = None) -> List[str]:
@@ -6,14 +6,29 @@ for device communication and parses Unreal's `ConsoleHelp.html` via
 """
 from __future__ import annotations
 
-import configparser
 import sys
+from functools import partial
+import threading
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    QStringListModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
+    QCheckBox,
     QComboBox,
     QCompleter,
     QHeaderView,
@@ -25,8 +40,7 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMenu,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QToolButton,
     QVBoxLayout,
@@ -34,17 +48,32 @@ from PySide6.QtWidgets import (
 )
 
 from .adb_client import (
-    ensure_adb_available,
-    get_default_device,
     list_devices,
     send_unreal_command,
+    send_unreal_command_all,
+    send_unreal_commands,
+    track_devices,
 )
+from .command_search import CommandSearchIndex
 from .commands_loader import UnrealCommand, load_commands
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 FAVOURITES_FILE = PROJECT_ROOT / "favourites.ini"
 HISTORY_FILE = PROJECT_ROOT / "history.ini"
 MAX_HISTORY = 50
+# Favourites/history edits are kept in memory and written once after this delay
+SETTINGS_FLUSH_DELAY_MS = 500
+# Filter box edits are coalesced into one table rebuild after this pause
+FILTER_DEBOUNCE_MS = 150
+# Recent filter terms whose matching rows are kept for backspace/retype
+FILTER_CACHE_SIZE = 64
+# Log lines arriving within this window are appended to the log view in one go
+LOG_FLUSH_DELAY_MS = 50
+# Oldest log lines are dropped past this many, bounding memory in long sessions
+MAX_LOG_LINES = 2000
+# Reconnect delays for the device watcher after the adb server goes away
+DEVICE_WATCH_RETRY_S = 1.0
+DEVICE_WATCH_MAX_RETRY_S = 30.0
 DEFAULT_FAVOURITES = [
     "stat unit",
     "stat fps",
@@ -54,127 +83,250 @@ DEFAULT_FAVOURITES = [
 ]
 
 
-def load_favourite_commands(path: Path = FAVOURITES_FILE) -> list[str]:
-    """Load favourite commands from INI file."""
-    config = configparser.ConfigParser()
+def _read_section(path: Path, section: str) -> list[str]:
+    """Return the command values stored as `cmdN = ...` lines under [section]."""
+    commands = []
+    in_section = False
     try:
-        config.read(path, encoding="utf-8")
-        if "Commands" in config:
-            # INI stores as key=value; we use the value part
-            favourites = [cmd for cmd in config["Commands"].values() if cmd.strip()]
-            return favourites if favourites else DEFAULT_FAVOURITES.copy()
+        # Iterate the file object so no full-text copy or split list is built
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] in "#;":
+                    continue
+                if line[0] == "[" and line[-1] == "]":
+                    in_section = line[1:-1].strip() == section
+                    continue
+                if in_section:
+                    _, sep, value = line.partition("=")
+                    value = value.strip()
+                    if sep and value:
+                        commands.append(value)
+    except (OSError, UnicodeDecodeError):
+        return []
+    return commands
+
+
+def _write_section(path: Path, section: str, commands: list[str]) -> bool:
+    """Write commands as numbered `cmdN = ...` lines under a single [section] header."""
+    lines = [f"[{section}]"]
+    lines.extend(f"cmd{idx} = {cmd}" for idx, cmd in enumerate(commands, start=1))
+    try:
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return True
     except Exception:
-        pass
-    return DEFAULT_FAVOURITES.copy()
+        return False
+
+
+def load_favourite_commands(path: Path = FAVOURITES_FILE) -> list[str]:
+    """Load favourite commands from INI file."""
+    favourites = _read_section(path, "Commands")
+    return favourites if favourites else DEFAULT_FAVOURITES.copy()
 
 
 def load_history_commands(path: Path = HISTORY_FILE) -> list[str]:
     """Load command history from INI file (most-recent first)."""
-    config = configparser.ConfigParser()
-    try:
-        config.read(path, encoding="utf-8")
-        if "History" in config:
-            return [cmd for cmd in config["History"].values() if cmd.strip()]
-    except Exception:
-        pass
-    return []
+    return _read_section(path, "History")
 
 
 def save_history_commands(commands: list[str], path: Path = HISTORY_FILE) -> bool:
     """Persist command history to INI file."""
-    config = configparser.ConfigParser()
-    config["History"] = {}
-    for idx, cmd in enumerate(commands, start=1):
-        config["History"][f"cmd{idx}"] = cmd
-    try:
-        with path.open("w", encoding="utf-8") as f:
-            config.write(f)
-        return True
-    except Exception:
-        return False
+    return _write_section(path, "History", commands)
 
 
-def add_history_command(command: str, path: Path = HISTORY_FILE) -> bool:
-    """Insert command into history (most-recent first) and persist."""
-    if not command.strip():
-        return False
-    history = load_history_commands(path)
-    history = [cmd for cmd in history if cmd != command]
-    history.insert(0, command)
-    history = history[:MAX_HISTORY]
-    return save_history_commands(history, path)
+def save_favourite_commands(commands: list[str], path: Path = FAVOURITES_FILE) -> bool:
+    """Persist favourite commands to INI file."""
+    return _write_section(path, "Commands", commands)
 
 
-def save_favourite_command(command: str, path: Path = FAVOURITES_FILE) -> bool:
-    """Save a command to favourites INI file. Returns True if successful."""
-    if not command.strip():
-        return False
-    
-    config = configparser.ConfigParser()
-    
-    # Load existing favourites
-    try:
-        config.read(path, encoding="utf-8")
-    except Exception:
-        pass
-    
-    # Ensure Commands section exists
-    if "Commands" not in config:
-        config["Commands"] = {}
-    
-    # Check if command already exists
-    existing_commands = [cmd for cmd in config["Commands"].values()]
-    if command in existing_commands:
-        return False  # Already exists
-    
-    # Add new command with a numbered key
-    key_num = len(config["Commands"]) + 1
-    config["Commands"][f"cmd{key_num}"] = command
-    
-    # Write back to file
-    try:
-        with path.open("w", encoding="utf-8") as f:
-            config.write(f)
-        return True
-    except Exception:
-        return False
+class _CommandsLoaderSignals(QObject):
+    finished = Signal(list)
 
 
-def delete_favourite_command(command: str, path: Path = FAVOURITES_FILE) -> bool:
-    """Delete a command from favourites INI file. Returns True if successful."""
-    if not command.strip():
-        return False
-    
-    config = configparser.ConfigParser()
-    
-    # Load existing favourites
-    try:
-        config.read(path, encoding="utf-8")
-    except Exception:
-        return False
-    
-    if "Commands" not in config:
-        return False
-    
-    # Find and remove the command
-    key_to_delete = None
-    for key, value in config["Commands"].items():
-        if value == command:
-            key_to_delete = key
-            break
-    
-    if key_to_delete:
-        del config["Commands"][key_to_delete]
-        
-        # Write back to file
+class CommandsLoaderTask(QRunnable):
+    """Parse ConsoleHelp.html on a pool thread and emit the command list."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _CommandsLoaderSignals()
+
+    def run(self):
+        self.signals.finished.emit(load_commands())
+
+
+class _DeviceListSignals(QObject):
+    finished = Signal(list, str)  # devices, error message ("" if adb answered)
+
+
+class DeviceListTask(QRunnable):
+    """Query the adb server for connected devices on a pool thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _DeviceListSignals()
+
+    def run(self):
         try:
-            with path.open("w", encoding="utf-8") as f:
-                config.write(f)
+            devices, error = list_devices(), ""
+        except Exception as e:
+            devices, error = [], f"ADB not available: {e}"
+        self.signals.finished.emit(devices, error)
+
+
+class _SendSignals(QObject):
+    finished = Signal(object)  # the send function's return value
+
+
+class SendTask(QRunnable):
+    """Run a blocking adb send function on a pool thread and emit its result."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.signals = _SendSignals()
+        self._fn = fn
+        self._args = args
+
+    def run(self):
+        self.signals.finished.emit(self._fn(*self._args))
+
+
+class DeviceWatcher(QObject):
+    """Follow adb's track-devices stream and emit the device list on every change.
+
+    The stream blocks on a socket read with no way to interrupt it, so it
+    runs on a daemon thread rather than a QThread/pool thread that would
+    have to be joined on exit. Lost adb connections are retried with
+    exponential backoff.
+    """
+
+    devices_changed = Signal(list, str)  # devices, error message ("" if adb answered)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="adb-track-devices", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        delay = DEVICE_WATCH_RETRY_S
+        while not self._stopped.is_set():
+            try:
+                for _ in track_devices():
+                    if self._stopped.is_set():
+                        return
+                    self.devices_changed.emit(list_devices(), "")
+                    delay = DEVICE_WATCH_RETRY_S
+            except Exception as e:
+                if self._stopped.is_set():
+                    return
+                self.devices_changed.emit([], f"ADB not available: {e}")
+            if self._stopped.wait(delay):
+                return
+            delay = min(delay * 2, DEVICE_WATCH_MAX_RETRY_S)
+
+
+class CommandModel(QAbstractTableModel):
+    """Read-only (Command, Help) table over a list of UnrealCommand.
+
+    Qt only asks for the rows it paints, so swapping the list is O(1)
+    regardless of catalog size. flags() is deliberately not overridden: the
+    inherited ItemIsSelectable | ItemIsEnabled is already non-editable and
+    costs no Python call per cell.
+    """
+
+    HEADERS = ("Command", "Help")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[UnrealCommand] = []
+
+    def set_rows(self, rows: list[UnrealCommand]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def command_at(self, row: int) -> UnrealCommand:
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        cmd = self._rows[index.row()]
+        return cmd.name if index.column() == 0 else cmd.help
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class CommandFilterProxy(QSortFilterProxyModel):
+    """Case-insensitive substring filter over each command's precomputed haystack.
+
+    Filtering only hides/shows rows of the source CommandModel; nothing is
+    rebuilt on the Python side. Matching source rows are memoized per term
+    in a small LRU, and a term extending a cached one only rescans that
+    term's matches.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._term = ""
+        self._accepted: Optional[frozenset[int]] = None
+        self._cache: OrderedDict[str, frozenset[int]] = OrderedDict()
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        # Runs before the proxy re-filters on reset, so no stale row numbers are used
+        model.modelAboutToBeReset.connect(self._clear_cache)
+
+    def set_term(self, term: str):
+        """Filter by an already casefolded term ("" shows every row)."""
+        self.beginFilterChange()
+        self._term = term
+        self._accepted = None
+        self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+
+    def _clear_cache(self):
+        self._cache.clear()
+        self._accepted = None
+
+    def _matching_rows(self, term: str) -> frozenset[int]:
+        cached = self._cache.get(term)
+        if cached is not None:
+            self._cache.move_to_end(term)
+            return cached
+        model = self.sourceModel()
+        candidates = range(model.rowCount())
+        # Rows matching a longer term are a subset of those matching its prefix
+        for end in range(len(term) - 1, 0, -1):
+            narrower = self._cache.get(term[:end])
+            if narrower is not None:
+                candidates = narrower
+                break
+        rows = frozenset(row for row in candidates if term in model.command_at(row).haystack_cf)
+        self._cache[term] = rows
+        if len(self._cache) > FILTER_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return rows
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:  # noqa: ARG002
+        if not self._term:
             return True
-        except Exception:
-            return False
-    
-    return False
+        if self._accepted is None:
+            self._accepted = self._matching_rows(self._term)
+        return source_row in self._accepted
 
 
 class MainWindow(QMainWindow):
@@ -197,37 +349,63 @@ class MainWindow(QMainWindow):
         device_row.addWidget(self.device_combo)
         device_row.addWidget(self.refresh_button)
         root_layout.addLayout(device_row)
-
-        # Load favourites from text file
+        self._device_task: Optional[DeviceListTask] = None
+        # Sends run one at a time off the UI thread, so commands reach the device in click order
+        self._send_pool = QThreadPool(self)
+        self._send_pool.setMaxThreadCount(1)
+        self._send_tasks: set[SendTask] = set()
+        # The first background scan doubles as the startup adb availability check
+        self._adb_status_logged = False
+        self._devices_by_serial: dict = {}
+        # Device object for the current combo selection, resolved once per change
+        self._adb_device = None
+        self.device_combo.currentIndexChanged.connect(self._on_device_changed)
+
+        # Load favourites/history once; edits are flushed to disk by _flush_settings
         self.favourite_commands: list[str] = load_favourite_commands()
-        self.history_commands: list[str] = load_history_commands()
-
-        # Load full command catalog from HTML; fall back to favourites if missing
-        self.full_commands: list[UnrealCommand] = load_commands()
-        self.full_catalog_available = bool(self.full_commands)
-        if not self.full_commands:
-            self.full_commands = [
-                UnrealCommand(name=cmd, help="", type="")
-                for cmd in self.favourite_commands
-            ]
-        self.full_command_names = [c.name for c in self.full_commands]
+        self.history_commands: deque[str] = deque(load_history_commands(), maxlen=MAX_HISTORY)
+        self._favourites_dirty = False
+        self._history_dirty = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(SETTINGS_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self._flush_settings)
+
+        # Full command catalog is parsed in the background (see _on_commands_loaded);
+        # favourites stand in for it until then
+        self.full_commands: list[UnrealCommand] = []
+        self.full_catalog_available = False
+        self.full_command_names: list[str] = []
+        self._last_filter_term: Optional[str] = None
 
         # Command input row + autocomplete
         cmd_row = QHBoxLayout()
         self.command_input = QLineEdit()
         self.command_input.setPlaceholderText("Type Unreal command; autocomplete active")
+        self.match_anywhere_check = QCheckBox("Match anywhere")
+        self.match_anywhere_check.setToolTip("Autocomplete names containing the text, not just starting with it")
         self.send_button = QPushButton("Send")
         self.send_button.clicked.connect(self.send_manual_command)
+        self.send_all_button = QPushButton("Send to All")
+        self.send_all_button.clicked.connect(self.send_manual_command_all)
         self.command_input.returnPressed.connect(self.send_manual_command)
         self.save_fav_button = QPushButton("Save to Favourites")
         self.save_fav_button.clicked.connect(self.save_current_to_favourites)
         cmd_row.addWidget(QLabel("Command:"))
         cmd_row.addWidget(self.command_input, 4)
+        cmd_row.addWidget(self.match_anywhere_check)
         cmd_row.addWidget(self.send_button)
+        cmd_row.addWidget(self.send_all_button)
         cmd_row.addWidget(self.save_fav_button)
         root_layout.addLayout(cmd_row)
 
-        self.completer = QCompleter(self.full_command_names)
+        # The completer's model only ever holds the current matches: each edit
+        # queries the SQLite index and swaps the string list in place.
+        self._command_index = CommandSearchIndex()
+        self._completer_model = QStringListModel(self)
+        self.command_input.textEdited.connect(self._update_completions)
+        self.match_anywhere_check.toggled.connect(lambda: self._update_completions(self.command_input.text()))
+        self.completer = QCompleter(self._completer_model, self)
         self.completer.setCaseSensitivity(Qt.CaseInsensitive)
         self.completer.setFilterMode(Qt.MatchContains)
         self.completer.setCompletionMode(QCompleter.PopupCompletion)
@@ -238,6 +416,7 @@ class MainWindow(QMainWindow):
 
         fav_col = QVBoxLayout()
         self.fav_list = QListWidget()
+        self.fav_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.fav_list.itemDoubleClicked.connect(self.send_selected_favorite)
         self.fav_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.fav_list.customContextMenuRequested.connect(self.show_favourites_context_menu)
@@ -273,29 +452,43 @@ class MainWindow(QMainWindow):
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Filter (substring, case-insensitive)")
         self.filter_input.textChanged.connect(self.filter_full_list)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        # Shorter non-empty terms leave the table as is (raise for huge catalogs)
+        self.search_min_length = 1
         self.reset_filter_btn = QPushButton("Clear")
         self.reset_filter_btn.clicked.connect(lambda: self.filter_input.clear())
         filter_row.addWidget(QLabel("Search:"))
         filter_row.addWidget(self.filter_input, 4)
         filter_row.addWidget(self.reset_filter_btn)
         full_layout.addLayout(filter_row)
-        self.full_table = QTableWidget()
-        self.full_table.setColumnCount(2)
-        self.full_table.setHorizontalHeaderLabels(["Command", "Help"])
+        self._model = CommandModel(self)
+        self._proxy = CommandFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
+        self.full_table = QTableView()
+        self.full_table.setModel(self._proxy)
         header = self.full_table.horizontalHeader()
         header.setStretchLastSection(True)
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.full_table.verticalHeader().setVisible(False)
-        self.full_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.full_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.full_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.full_table.cellDoubleClicked.connect(self.send_selected_full)
+        self.full_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.full_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.full_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.full_table.doubleClicked.connect(self.send_selected_full)
         full_layout.addWidget(self.full_table, 4)
         root_layout.addWidget(self.full_panel, 3)
 
         # Log output
         self.log = QTextEdit()
         self.log.setReadOnly(True)
+        self.log.document().setMaximumBlockCount(MAX_LOG_LINES)
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_DELAY_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         root_layout.addWidget(QLabel("Log:"))
         root_layout.addWidget(self.log, 1)
 
@@ -304,64 +497,83 @@ class MainWindow(QMainWindow):
 
         self.populate_favourites()
         self.populate_history()
-        self.populate_full_list()
+        self._set_catalog(self._favourite_placeholders())
         self.refresh_devices()
 
+        self._commands_task = CommandsLoaderTask()
+        self._commands_task.signals.finished.connect(self._on_commands_loaded)
+        QThreadPool.globalInstance().start(self._commands_task)
+
+        # adb pushes device changes, so the combo updates without polling
+        self._device_watcher = DeviceWatcher(self)
+        self._device_watcher.devices_changed.connect(self._apply_device_list)
+        self._device_watcher.start()
+
+    # -------- Utility methods --------
+    def append_log(self, text: str):
+        """Queue a log line; bursts are laid out once by _flush_log."""
+        self._log_buf.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        # One repaint per batch; each line is still appended (and format-detected) on its own
+        self.log.setUpdatesEnabled(False)
+        for line in self._log_buf:
+            self.log.append(line)
+        self._log_buf.clear()
+        self.log.setUpdatesEnabled(True)
+
+    def current_device(self):  # returns adbutils device or None
+        return self._adb_device
+
+    def _on_device_changed(self, index: int):  # noqa: ARG002
+        # Devices are cached by the last refresh; no adb round-trip per selection
+        self._adb_device = self._devices_by_serial.get(self.device_combo.currentData())
+
+    def _on_commands_loaded(self, commands: list[UnrealCommand]):
+        """Install the catalog parsed by CommandsLoaderTask; fall back to favourites if missing."""
+        self._commands_task = None
+        self.full_catalog_available = bool(commands)
+        self._set_catalog(commands or self._favourite_placeholders())
+
         if not self.full_catalog_available:
             self.append_log("ConsoleHelp.html not found or unreadable; using favourites list for autocomplete.")
         else:
             self.append_log(f"Loaded {len(self.full_command_names)} commands from ConsoleHelp.html.")
 
-        # Periodic auto-refresh (optional) every 15s to catch new devices
-        self.auto_refresh_timer = QTimer(self)
-        self.auto_refresh_timer.timeout.connect(self.refresh_devices)
-        self.auto_refresh_timer.start(15000)
+    def _favourite_placeholders(self) -> list[UnrealCommand]:
+        return [UnrealCommand(name=cmd, help="", type="") for cmd in self.favourite_commands]
 
-        ok, msg = ensure_adb_available()
-        self.append_log(msg)
-        if not ok:
-            self.status_bar.showMessage("ADB issue: " + msg)
-        else:
-            self.status_bar.showMessage(msg)
-
-    # -------- Utility methods --------
-    def append_log(self, text: str):
-        self.log.append(text)
+    def _set_catalog(self, commands: list[UnrealCommand]):
+        """Point autocomplete and the All Commands table at a new command list."""
+        self.full_commands = commands
+        self.full_command_names = [c.name for c in commands]
+        self._command_index.set_names(self.full_command_names)
+        self.populate_full_list()
+        # Re-apply whatever the user typed into the filter so far
+        self._last_filter_term = None
+        self._apply_filter()
 
-    def current_device(self):  # returns adbutils device or None
-        idx = self.device_combo.currentIndex()
-        if idx < 0:
-            return None
-        serial = self.device_combo.currentData()
-        if not serial:
-            return None
-        # Retrieve the matching device from list
-        for dev in list_devices():
-            if dev.serial == serial:
-                return dev
-        return None
+    def _update_completions(self, text: str):
+        if self.match_anywhere_check.isChecked():
+            matches = self._command_index.search(text)
+        else:
+            matches = self._command_index.search_prefix(text)
+        self._completer_model.setStringList(matches)
 
     def populate_favourites(self):
         self.fav_list.clear()
-        for cmd in self.favourite_commands:
-            QListWidgetItem(cmd, self.fav_list)
+        self.fav_list.addItems(self.favourite_commands)
 
     def populate_history(self):
         self.history_list.clear()
-        for cmd in self.history_commands:
-            QListWidgetItem(cmd, self.history_list)
-
-    def populate_full_list(self, commands: Optional[list[UnrealCommand]] = None):
-        data = commands if commands is not None else self.full_commands
-        self.filtered_commands = data
-        self.full_table.setRowCount(len(data))
-        for row, cmd in enumerate(data):
-            command_item = QTableWidgetItem(cmd.name)
-            help_item = QTableWidgetItem(cmd.help)
-            command_item.setFlags(command_item.flags() & ~Qt.ItemIsEditable)
-            help_item.setFlags(help_item.flags() & ~Qt.ItemIsEditable)
-            self.full_table.setItem(row, 0, command_item)
-            self.full_table.setItem(row, 1, help_item)
+        self.history_list.addItems(list(self.history_commands))
+
+    def populate_full_list(self):
+        self._model.set_rows(self.full_commands)
 
     def toggle_full_panel(self, checked: bool):
         self.full_panel.setVisible(checked)
@@ -369,44 +581,112 @@ class MainWindow(QMainWindow):
         self.full_toggle.setText("Hide All Commands" if checked else "Show All Commands")
 
     def filter_full_list(self):
-        term = self.filter_input.text().strip().lower()
-        if not term:
-            filtered = self.full_commands
-        else:
-            filtered = [
-                cmd
-                for cmd in self.full_commands
-                if term in cmd.name.lower() or term in cmd.help.lower()
-            ]
-        self.populate_full_list(filtered)
+        """Restart the debounce timer; the table is rebuilt once typing pauses."""
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        term = self.filter_input.text().strip().casefold()
+        if term and len(term) < self.search_min_length:
+            return
+        # Edits that normalise to the same term (case, surrounding spaces) change nothing
+        if term == self._last_filter_term:
+            return
+        self._last_filter_term = term
+        self._proxy.set_term(term)
+
+    # -------- Favourites / history persistence --------
+    def _add_history(self, cmd: str):
+        """Move cmd to the front of the in-memory history and schedule a flush."""
+        try:
+            self.history_commands.remove(cmd)
+        except ValueError:
+            pass
+        self.history_commands.appendleft(cmd)
+        self._history_dirty = True
+        self._flush_timer.start()
+        self.populate_history()
+
+    def _flush_settings(self):
+        """Write favourites/history to disk if they changed since the last flush."""
+        self._flush_timer.stop()
+        if self._history_dirty:
+            self._history_dirty = not save_history_commands(list(self.history_commands))
+        if self._favourites_dirty:
+            self._favourites_dirty = not save_favourite_commands(self.favourite_commands)
+
+    def closeEvent(self, event):
+        self._device_watcher.stop()
+        self._flush_settings()
+        super().closeEvent(event)
 
     # -------- ADB / devices --------
     def refresh_devices(self):
-        devices = list_devices()
-        selected_serial = self.device_combo.currentData()
-        self.device_combo.clear()
-        for dev in devices:
-            self.device_combo.addItem(dev.serial, dev.serial)
-        if devices:
-            self.status_bar.showMessage(f"{len(devices)} device(s) available.")
+        """Start a background device scan; ignored while one is already in flight."""
+        if self._device_task is not None:
+            return
+        self._device_task = DeviceListTask()
+        self._device_task.signals.finished.connect(self._on_device_task_finished)
+        QThreadPool.globalInstance().start(self._device_task)
+
+    def _on_device_task_finished(self, devices: list, error: str):
+        self._device_task = None
+        self._apply_device_list(devices, error)
+
+    def _apply_device_list(self, devices: list, error: str = ""):
+        if not self._adb_status_logged:
+            self._adb_status_logged = True
+            if error:
+                self.append_log(error)
+            elif devices:
+                self.append_log(f"{len(devices)} device(s) detected.")
+            else:
+                self.append_log("ADB reachable but no devices detected.")
+        previous_serials = list(self._devices_by_serial)
+        self._devices_by_serial = {dev.serial: dev for dev in devices}
+        if list(self._devices_by_serial) == previous_serials:
+            # Same devices as last scan: keep the combo, just re-pin the fresh device object
+            self._adb_device = self._devices_by_serial.get(self.device_combo.currentData())
+        else:
+            selected_serial = self.device_combo.currentData()
+            self.device_combo.clear()
+            for dev in devices:
+                self.device_combo.addItem(dev.serial, dev.serial)
             # Restore previous selection if possible
             if selected_serial:
                 idx = self.device_combo.findData(selected_serial)
                 if idx >= 0:
                     self.device_combo.setCurrentIndex(idx)
+        if devices:
+            self.status_bar.showMessage(f"{len(devices)} device(s) available.")
+        elif error:
+            self.status_bar.showMessage("ADB issue: " + error)
         else:
             self.status_bar.showMessage("No devices connected.")
 
     # -------- Sending commands --------
+    def _run_send(self, on_done, fn, *args):
+        """Run fn(*args) on the send pool and pass its result to on_done on the UI thread."""
+        task = SendTask(fn, *args)
+        self._send_tasks.add(task)
+
+        def finished(result):
+            self._send_tasks.discard(task)
+            on_done(result)
+
+        task.signals.finished.connect(finished)
+        self._send_pool.start(task)
+
     def _send_command(self, cmd: str):
         if not cmd.strip():
             return
-        dev = self.current_device() or get_default_device()
+        # None only when no device is known; adb_client then resolves its own default
+        dev = self.current_device()
         self.append_log(f"Sending: {cmd}")
-        ok, msg = send_unreal_command(cmd, dev)
-        if add_history_command(cmd):
-            self.history_commands = load_history_commands()
-            self.populate_history()
+        self._add_history(cmd)
+        self._run_send(partial(self._on_command_sent, cmd), send_unreal_command, cmd, dev)
+
+    def _on_command_sent(self, cmd: str, result: tuple[bool, str]):
+        ok, msg = result
         if ok:
             self.append_log(f"OK: {msg}")
             self.status_bar.showMessage(f"Sent '{cmd}'")
@@ -414,23 +694,60 @@ class MainWindow(QMainWindow):
             self.append_log(f"ERROR: {msg}")
             self.status_bar.showMessage(f"Failed '{cmd}'")
 
+    def _send_commands(self, cmds: list[str]):
+        """Send several commands to the current device in one adb shell call."""
+        cmds = [cmd for cmd in cmds if cmd.strip()]
+        if not cmds:
+            return
+        dev = self.current_device()
+        self.append_log(f"Sending {len(cmds)} commands: {'; '.join(cmds)}")
+        for cmd in cmds:
+            self._add_history(cmd)
+        self._run_send(partial(self._on_commands_sent, len(cmds)), send_unreal_commands, cmds, dev)
+
+    def _on_commands_sent(self, count: int, result: tuple[bool, str]):
+        ok, msg = result
+        if ok:
+            self.append_log(f"OK: {msg}")
+            self.status_bar.showMessage(f"Sent {count} commands")
+        else:
+            self.append_log(f"ERROR: {msg}")
+            self.status_bar.showMessage(f"Failed to send {count} commands")
+
     def send_manual_command(self):
         cmd = self.command_input.text()
         self._send_command(cmd)
 
+    def send_manual_command_all(self):
+        """Broadcast the typed command to every known device in parallel."""
+        cmd = self.command_input.text()
+        if not cmd.strip():
+            return
+        devices = list(self._devices_by_serial.values())
+        if not devices:
+            self.append_log("ERROR: No ADB devices connected.")
+            self.status_bar.showMessage(f"Failed '{cmd}'")
+            return
+        self.append_log(f"Sending to {len(devices)} device(s): {cmd}")
+        self._add_history(cmd)
+        self._run_send(partial(self._on_command_sent_all, cmd), send_unreal_command_all, cmd, devices)
+
+    def _on_command_sent_all(self, cmd: str, results: list[tuple[str, bool, str]]):
+        for serial, ok, msg in results:
+            self.append_log(f"{'OK' if ok else 'ERROR'} [{serial}]: {msg}")
+        sent = sum(1 for _, ok, _ in results if ok)
+        self.status_bar.showMessage(f"Sent '{cmd}' to {sent}/{len(results)} device(s)")
+
     def send_selected_favorite(self, item: QListWidgetItem):
         self._send_command(item.text())
 
     def send_selected_history(self, item: QListWidgetItem):
         self._send_command(item.text())
 
-    def send_selected_full(self, row: int, column: int):  # noqa: ARG002
-        if row < 0:
-            return
-        command_item = self.full_table.item(row, 0)
-        if not command_item:
+    def send_selected_full(self, index: QModelIndex):
+        if not index.isValid():
             return
-        command = command_item.text()
+        command = self._model.command_at(self._proxy.mapToSource(index).row()).name
         self.command_input.setText(command)
         self.command_input.setFocus()
         self.status_bar.showMessage(f"Prepared '{command}' — edit arguments and press Send")
@@ -442,8 +759,10 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("No command to save")
             return
         
-        if save_favourite_command(cmd):
-            self.favourite_commands = load_favourite_commands()
+        if cmd not in self.favourite_commands:
+            self.favourite_commands.append(cmd)
+            self._favourites_dirty = True
+            self._flush_timer.start()
             self.populate_favourites()
             self.append_log(f"Saved to favourites: {cmd}")
             self.status_bar.showMessage(f"Saved '{cmd}' to favourites")
@@ -457,8 +776,12 @@ class MainWindow(QMainWindow):
         if not item:
             return
         
+        selected = [selected_item.text() for selected_item in self.fav_list.selectedItems()]
         menu = QMenu(self)
         send_action = menu.addAction("Send Command")
+        send_selected_action = None
+        if len(selected) > 1:
+            send_selected_action = menu.addAction(f"Send {len(selected)} Selected")
         copy_action = menu.addAction("Copy to Command Box")
         menu.addSeparator()
         delete_action = menu.addAction("Delete Favourite")
@@ -467,6 +790,8 @@ class MainWindow(QMainWindow):
         
         if action == send_action:
             self._send_command(item.text())
+        elif send_selected_action is not None and action == send_selected_action:
+            self._send_commands(selected)
         elif action == copy_action:
             self.command_input.setText(item.text())
             self.command_input.setFocus()
@@ -476,8 +801,10 @@ class MainWindow(QMainWindow):
     
     def delete_favourite(self, command: str):
         """Delete a favourite command."""
-        if delete_favourite_command(command):
-            self.favourite_commands = load_favourite_commands()
+        if command in self.favourite_commands:
+            self.favourite_commands.remove(command)
+            self._favourites_dirty = True
+            self._flush_timer.start()
             self.populate_favourites()
             self.append_log(f"Deleted from favourites: {command}")
             self.status_bar.showMessage(f"Deleted '{command}' from favourites")